@@ -142,18 +142,21 @@ generate_version_comparison() {
     
     echo "Generating version comparison across all toolchain versions..."
     
-    # Collect all unique CPU names across all versions
-    local all_cpus_file=$(mktemp)
+    # Tag each existing version file with its position in VERSIONS so awk
+    # can read every file exactly once
+    local version_args=()
+    local index=0
     for version in "${VERSIONS[@]}"; do
+        index=$((index + 1))
         if [ -f "$output_dir/$version/mcpu_list.csv" ]; then
-            # Skip header line and extract CPU column
-            tail -n +2 "$output_dir/$version/mcpu_list.csv" | cut -d, -f1 >> "$all_cpus_file"
+            version_args+=("v=$index" "$output_dir/$version/mcpu_list.csv")
         fi
     done
-    
-    # Sort and get unique CPU names
+
+    # Collect all unique CPU names across all versions in one pass, skipping
+    # each header line
     local unique_cpus_file=$(mktemp)
-    sort "$all_cpus_file" | uniq > "$unique_cpus_file"
+    awk -F, 'FNR > 1 { print $1 }' "${version_args[@]}" /dev/null | sort | uniq > "$unique_cpus_file"
     
     # Create header row with version numbers
     echo -n "CPU" > "$comparison_file"
@@ -162,35 +165,24 @@ generate_version_comparison() {
     done
     echo "" >> "$comparison_file"
     
-    # Process each CPU
-    while read -r cpu; do
-        echo -n "$cpu" >> "$comparison_file"
-        
-        # Check each version
-        for version in "${VERSIONS[@]}"; do
-            local gcc_mark=""
-            local clang_mark=""
-            
-            if [ -f "$output_dir/$version/mcpu_list.csv" ]; then
-                # Check if this CPU is supported by GCC in this version
-                if grep -q "^$cpu,X," "$output_dir/$version/mcpu_list.csv"; then
-                    gcc_mark="X"
-                fi
-                
-                # Check if this CPU is supported by Clang in this version
-                if grep -q "^$cpu,.*,X$" "$output_dir/$version/mcpu_list.csv"; then
-                    clang_mark="X"
-                fi
-            fi
-            
-            echo -n ",$gcc_mark,$clang_mark" >> "$comparison_file"
-        done
-        
-        echo "" >> "$comparison_file"
-    done < "$unique_cpus_file"
+    # Load the GCC/Clang marks of all versions, then emit one row per CPU
+    awk -F, -v versions="${#VERSIONS[@]}" '
+        v && FNR > 1 {
+            if (NF > 2 && $2 == "X") gcc[v, $1] = 1
+            if (NF > 2 && $NF == "X") clang[v, $1] = 1
+            next
+        }
+        !v {
+            row = $0
+            for (i = 1; i <= versions; i++) {
+                row = row "," ((i, $0) in gcc ? "X" : "") "," ((i, $0) in clang ? "X" : "")
+            }
+            print row
+        }
+    ' "${version_args[@]}" v=0 "$unique_cpus_file" >> "$comparison_file"
     
     # Clean up
-    rm -f "$all_cpus_file" "$unique_cpus_file"
+    rm -f "$unique_cpus_file"
     
     echo "Version comparison saved to $comparison_file"
     
@@ -7,11 +7,24 @@ to an Excel XLSX file with conditional formatting (Y=green, N=red).
 """
 
 import argparse
+import functools
 import os
 import pandas as pd
 import openpyxl
+import xlsxwriter
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.formatting.rule import CellIsRule
+from openpyxl.cell import WriteOnlyCell
+
+# Shared styles, built once instead of on every sheet. Colors are 8-digit
+# ARGB: a 6-digit value gets a transparent 00 alpha channel from openpyxl.
+_GREEN = PatternFill(start_color="FFCCFFCC", end_color="FFCCFFCC", fill_type="solid")
+_RED = PatternFill(start_color="FFFFCCCC", end_color="FFFFCCCC", fill_type="solid")
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="FFE0E0E0", end_color="FFE0E0E0", fill_type="solid")
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_THIN_SIDE = Side(style='thin')
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -34,31 +47,37 @@ def parse_arguments():
     
     return parser.parse_args()
 
-def apply_conditional_formatting(worksheet, start_col, data_rows):
-    """Apply conditional formatting to Y/N cells."""
-    # Define fills for Y and N values
-    green_fill = PatternFill(start_color="CCFFCC", end_color="CCFFCC", fill_type="solid")
-    red_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-    
-    # Get the last column letter
-    last_col = openpyxl.utils.get_column_letter(worksheet.max_column)
+@functools.lru_cache(maxsize=None)
+def _col(n):
+    """Return the letter of column n, cached across sheets."""
+    return openpyxl.utils.get_column_letter(n)
+
+@functools.lru_cache(maxsize=None)
+def _data_range(start_col, data_rows, data_cols):
+    """Return the Y/N data range, shared by sheets with the same shape."""
     first_data_row = 2  # Header is row 1
-    
+    return f"{start_col}{first_data_row}:{_col(data_cols)}{data_rows + first_data_row - 1}"
+
+def apply_conditional_formatting(worksheet, start_col, data_rows, data_cols):
+    """Apply conditional formatting to Y/N cells."""
     # Apply conditional formatting rules to the data range
-    data_range = f"{start_col}{first_data_row}:{last_col}{data_rows + first_data_row - 1}"
+    data_range = _data_range(start_col, data_rows, data_cols)
     
     # Add the rules
     worksheet.conditional_formatting.add(
         data_range,
-        CellIsRule(operator="equal", formula=['"Y"'], fill=green_fill)
+        CellIsRule(operator="equal", formula=['"Y"'], fill=_GREEN)
     )
     worksheet.conditional_formatting.add(
         data_range,
-        CellIsRule(operator="equal", formula=['"N"'], fill=red_fill)
+        CellIsRule(operator="equal", formula=['"N"'], fill=_RED)
     )
 
-def format_worksheet(worksheet, freeze=True, has_description=True):
-    """Format the worksheet with styling and column widths."""
+def format_worksheet(worksheet, columns, freeze=True, has_description=True):
+    """Format the worksheet with column widths and return its styled header row.
+
+    The worksheet is write-only, so this must run before any row is appended.
+    """
     # Set column widths
     worksheet.column_dimensions['A'].width = 15  # Name
     worksheet.column_dimensions['B'].width = 8   # Version
@@ -67,70 +86,117 @@ def format_worksheet(worksheet, freeze=True, has_description=True):
         worksheet.column_dimensions['C'].width = 40  # Description
     
     # Set header style
-    header_font = Font(bold=True)
-    header_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
-    
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value=column)
+        cell.font = _HEADER_FONT
+        cell.fill = _HEADER_FILL
+        cell.alignment = _HEADER_ALIGN
+        cell.border = _THIN_BORDER
+        header.append(cell)
     
     # Freeze panes if requested
     if freeze:
         # If we have description, freeze first 3 columns, otherwise first 2
         freeze_col = 'D' if has_description else 'C'
         worksheet.freeze_panes = f"{freeze_col}2"
+    
+    return header
+
+def df_to_write_only_sheet(workbook, df, title, freeze, has_description):
+    """Stream a DataFrame into a new formatted sheet of a write-only workbook."""
+    worksheet = workbook.create_sheet(title)
+    worksheet.append(format_worksheet(worksheet, df.columns, freeze, has_description))
+    
+    # Empty CSV fields are NaN in pandas but must stay blank cells in Excel
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        worksheet.append(row)
+    
+    # Apply conditional formatting starting from the first data column
+    data_start_col = 'D' if has_description else 'C'
+    apply_conditional_formatting(worksheet, data_start_col, len(df), len(df.columns))
 
 def create_separate_sheets(df, output_file, freeze):
     """Create separate sheets for GCC and Clang."""
-    # Create Excel writer
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        # Get list of all compiler columns
-        all_cols = list(df.columns)
+    workbook = openpyxl.Workbook(write_only=True)
+    
+    # Get list of all compiler columns
+    all_cols = list(df.columns)
+    
+    # Base columns that always stay
+    base_cols = ['Name', 'Version']
+    if 'Description' in all_cols:
+        base_cols.append('Description')
+        has_description = True
+    else:
+        has_description = False
+    
+    # Filter for GCC and Clang columns
+    gcc_cols = [col for col in all_cols if col.startswith('gcc-')]
+    clang_cols = [col for col in all_cols if col.startswith('clang-')]
+    
+    # Create combined sheet with all data
+    df_to_write_only_sheet(workbook, df, 'All Extensions', freeze, has_description)
+    
+    # Create GCC sheet
+    if gcc_cols:
+        # Combine base columns with GCC columns
+        gcc_df = df[base_cols + gcc_cols]
+        df_to_write_only_sheet(workbook, gcc_df, 'GCC Extensions', freeze, has_description)
+    
+    # Create Clang sheet
+    if clang_cols:
+        # Combine base columns with Clang columns
+        clang_df = df[base_cols + clang_cols]
+        df_to_write_only_sheet(workbook, clang_df, 'Clang Extensions', freeze, has_description)
+    
+    workbook.save(output_file)
+
+def create_single_sheet(df, output_file, freeze):
+    """Create a single formatted sheet, streamed row by row with xlsxwriter.
+    
+    In constant_memory mode each row is flushed to disk once the next one is
+    started, so rows are written strictly in order here rather than through
+    DataFrame.to_excel, which emits cells column by column.
+    """
+    has_description = 'Description' in df.columns
+    
+    with xlsxwriter.Workbook(output_file, {'constant_memory': True}) as workbook:
+        worksheet = workbook.add_worksheet('Sheet1')
         
-        # Base columns that always stay
-        base_cols = ['Name', 'Version']
-        if 'Description' in all_cols:
-            base_cols.append('Description')
-            has_description = True
-        else:
-            has_description = False
+        # Set column widths
+        worksheet.set_column('A:A', 15)  # Name
+        worksheet.set_column('B:B', 8)   # Version
         
-        # Filter for GCC and Clang columns
-        gcc_cols = [col for col in all_cols if col.startswith('gcc-')]
-        clang_cols = [col for col in all_cols if col.startswith('clang-')]
+        if has_description:
+            worksheet.set_column('C:C', 40)  # Description
         
-        # Create combined sheet with all data
-        df.to_excel(writer, sheet_name='All Extensions', index=False)
+        # Freeze panes if requested
+        if freeze:
+            # If we have description, freeze first 3 columns, otherwise first 2
+            worksheet.freeze_panes(1, 3 if has_description else 2)
         
-        # Create GCC sheet
-        if gcc_cols:
-            # Combine base columns with GCC columns
-            gcc_df = df[base_cols + gcc_cols]
-            gcc_df.to_excel(writer, sheet_name='GCC Extensions', index=False)
+        # Write the styled header, then the data rows in order
+        header_format = workbook.add_format({
+            'bold': True, 'bg_color': '#E0E0E0', 'border': 1,
+            'align': 'center', 'valign': 'vcenter', 'text_wrap': True,
+        })
+        worksheet.write_row(0, 0, df.columns, header_format)
         
-        # Create Clang sheet
-        if clang_cols:
-            # Combine base columns with Clang columns
-            clang_df = df[base_cols + clang_cols]
-            clang_df.to_excel(writer, sheet_name='Clang Extensions', index=False)
+        # Empty CSV fields are NaN in pandas but must stay blank cells in Excel
+        values = df.astype(object).where(df.notna(), None)
+        for row_num, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_num, 0, row)
         
-        # Format all sheets after writing
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            
-            # Format the worksheet
-            format_worksheet(worksheet, freeze, has_description)
-            
-            # Apply conditional formatting
-            data_start_col = 'D' if has_description else 'C'
-            apply_conditional_formatting(worksheet, data_start_col, len(df))
+        # Apply conditional formatting starting from the first data column
+        data_start_col = 'D' if has_description else 'C'
+        data_range = _data_range(data_start_col, len(df), len(df.columns))
+        for value, color in (('Y', '#CCFFCC'), ('N', '#FFCCCC')):
+            worksheet.conditional_format(data_range, {
+                'type': 'cell', 'criteria': 'equal to', 'value': f'"{value}"',
+                'format': workbook.add_format({'bg_color': color}),
+            })
 
 def main():
     """Main function."""
@@ -148,7 +214,13 @@ def main():
     
     # Load CSV data
     try:
-        df = pd.read_csv(args.input_csv)
+        # Peek at the header so every column gets an explicit dtype instead
+        # of being inferred; Y/N flag columns are stored as categories
+        columns = pd.read_csv(args.input_csv, nrows=0).columns
+        dtype = {col: 'category' for col in columns if col.startswith(('gcc-', 'clang-'))}
+        dtype.update({col: 'string' for col in ('Name', 'Version', 'Description') if col in columns})
+        # Only empty fields are missing values, never names such as "NA"
+        df = pd.read_csv(args.input_csv, dtype=dtype, keep_default_na=False, na_values=[''])
     except pd.errors.EmptyDataError:
         print(f"Error: Input file '{args.input_csv}' is empty")
         return 1
@@ -166,19 +238,7 @@ def main():
         create_separate_sheets(df, args.output, args.freeze)
     else:
         # If not creating separate sheets, just format the main sheet
-        with pd.ExcelWriter(args.output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False)
-            worksheet = writer.sheets['Sheet1']
-            
-            # Check if Description column exists
-            has_description = 'Description' in df.columns
-            
-            # Format the worksheet
-            format_worksheet(worksheet, args.freeze, has_description)
-            
-            # Apply conditional formatting starting from the first data column
-            data_start_col = 'D' if has_description else 'C'
-            apply_conditional_formatting(worksheet, data_start_col, len(df))
+        create_single_sheet(df, args.output, args.freeze)
     
     print(f"✅ Successfully created {args.output}")
 
@@ -3,6 +3,82 @@ import csv
 import sys
 import re
 import os
+import mmap
+
+# Match pattern for name, version, and description
+PARSE_RE = re.compile(r"^\s*(\S+(?:\s+\S+)*?)\s+(\S+(?:,\s*\S+)*)\s*(.*)$")
+
+# Banner lines to skip, compared against the stripped line either whole
+# or by prefix rather than searched for as substrings
+SKIP_EXACT = frozenset([
+    "Use -march to specify the target's extension.",
+])
+SKIP_PREFIX = (
+    "All available -march extensions for RISC-V",
+    "Experimental ",
+    "Supported ",
+    "For example, clang",
+)
+
+# Header line of gcc (Name Version) and clang (Name Version Description)
+HEADER_RE = re.compile(r"Name\s+Version(?:\s+Description)?$")
+
+# Characters that force csv.writer to quote a field
+NEEDS_QUOTING = (",", '"', "\r", "\n")
+
+def parse_lines(lines):
+    """Parse compiler extension listing lines into [name, version, description] rows."""
+    rows = []
+    append = rows.append
+    match_header = HEADER_RE.match
+    match_line = PARSE_RE.match
+
+    for line in lines:
+        line = line.strip()
+        
+        # Skip banner, header and empty lines
+        if not line or line in SKIP_EXACT or line.startswith(SKIP_PREFIX) or match_header(line):
+            continue
+        
+        match = match_line(line)
+        if match:
+            # Groups start and end on non-space characters of the stripped
+            # line, so they need no further stripping
+            name, version, description = match.groups()
+            
+            # Special handling for new GCC format
+            if version.endswith(',') and description and description[0].isdigit():
+                version = version + description
+                description = ""
+            
+            # If we have a version at the end but no description
+            if not description and ' ' in name:
+                # Try to extract version from the end of name
+                parts = name.split()
+                if len(parts) >= 2:
+                    # Move last part to version if version is empty
+                    if not version:
+                        version = parts[-1]
+                        name = ' '.join(parts[:-1])
+            
+            # Check if version contains comma-separated values
+            if ',' in version:
+                # Split by comma and create a row for each version
+                for v in version.split(','):
+                    v = v.strip()
+                    if v:  # Skip empty versions
+                        append([name, v, description])
+            else:
+                append([name, version, description])
+        elif line:  # If line is not empty but didn't match the pattern
+            parts = line.split()
+            if len(parts) >= 2:
+                # Simple fallback parsing
+                version = parts[-1]
+                name = ' '.join(parts[:-1])
+                append([name, version, ""])
+
+    return rows
 
 def main():
     if len(sys.argv) != 3:
@@ -19,76 +95,24 @@ def main():
     # Define header row with all possible columns
     rows = [["Name", "Version", "Description"]]
 
-    # Match pattern for name, version, and description
-    pattern = re.compile(r"^\s*(\S+(?:\s+\S+)*?)\s+(\S+(?:,\s*\S+)*)\s*(.*)$")
-    
-    # Lines to skip
-    skip_lines = [
-        "All available -march extensions for RISC-V",
-        "Experimental ",
-        "Supported ",
-        "Use -march to specify the target's extension.",
-        "For example, clang"
-    ]
-    
-    # Lines to skip that match patterns (header or empty lines)
-    skip_patterns = [
-        re.compile(r"^\s*$"),  # Empty lines
-        re.compile(r"^\s*Name\s+Version\s*$"),  # Header line of gcc
-        re.compile(r"^\s*Name\s+Version\s+Description\s*$")  # Header line of clang
-    ]
-
-    with open(input_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            
-            # Skip lines that are in the skip list
-            if any(skip_text in line for skip_text in skip_lines):
-                continue
-                
-            # Skip lines that match any pattern in skip_patterns
-            if any(skip_pattern.match(line) for skip_pattern in skip_patterns):
-                continue
-            
-            match = pattern.match(line)
-            if match:
-                name, version, description = match.groups()
-                
-                # Special handling for new GCC format
-                if version.endswith(',') and description.strip() and description.strip()[0].isdigit():
-                    version = version + description
-                    description = ""
-                
-                # If we have a version at the end but no description
-                if not description.strip() and ' ' in name:
-                    # Try to extract version from the end of name
-                    parts = name.split()
-                    if len(parts) >= 2:
-                        # Move last part to version if version is empty
-                        if not version.strip():
-                            version = parts[-1]
-                            name = ' '.join(parts[:-1])
-                
-                # Check if version contains comma-separated values
-                if ',' in version:
-                    # Split by comma and create a row for each version
-                    versions = [v.strip() for v in version.split(',')]
-                    for v in versions:
-                        if v:  # Skip empty versions
-                            rows.append([name.strip(), v, description.strip()])
-                else:
-                    rows.append([name.strip(), version.strip(), description.strip()])
-            elif line:  # If line is not empty but didn't match the pattern
-                parts = line.split()
-                if len(parts) >= 2:
-                    # Simple fallback parsing
-                    version = parts[-1]
-                    name = ' '.join(parts[:-1])
-                    rows.append([name, version, ""])
+    # Stream lines from a memory map instead of loading the whole file.
+    # Only non-empty regular files can be mapped; pipes, process
+    # substitutions and empty files are read as ordinary text streams.
+    if os.path.isfile(input_file) and os.path.getsize(input_file):
+        with open(input_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rows.extend(parse_lines(raw.decode("utf-8") for raw in iter(mm.readline, b"")))
+    else:
+        with open(input_file, "r", encoding="utf-8") as f:
+            rows.extend(parse_lines(f))
 
     with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+        # Only fields with delimiters, quotes or line breaks need the csv
+        # module's quoting; otherwise write all rows in one go
+        if any(char in field for row in rows for field in row for char in NEEDS_QUOTING):
+            writer = csv.writer(f)
+            writer.writerows(rows)
+        else:
+            f.write("".join(",".join(row) + "\r\n" for row in rows))
 
     print(f"[INFO] Conversion complete: {len(rows) - 1} rows written to {output_file}")
 
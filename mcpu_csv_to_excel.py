@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
+import csv
+import itertools
+import numpy as np
 import pandas as pd
 import argparse
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import openpyxl
+from openpyxl.utils import get_column_letter
+
+# Fields that parse as integers or floats
+INT_RE = re.compile(r"[+-]?\d+")
+FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+def number_value(value):
+    """Return a numeric CSV field as an int or float."""
+    return int(value) if INT_RE.fullmatch(value) else float(value)
 
 def convert_csv_to_excel(input_file, output_file=None, sheet_name=None):
     """
@@ -29,18 +44,51 @@ def convert_csv_to_excel(input_file, output_file=None, sheet_name=None):
         sheet_name = Path(input_file).stem
     
     print(f"Converting {input_file} to {output_file} (sheet: {sheet_name})")
+    write_csv_workbook(input_file, output_file, sheet_name)
+    print(f"Conversion complete: {output_file}")
+    return output_file
+
+def write_csv_workbook(input_file, output_file, sheet_name):
+    """
+    Write the rows of a CSV file to a single-sheet Excel file, without any output.
     
-    # Read the CSV file
-    df = pd.read_csv(input_file)
-    
-    # Write to Excel
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    Args:
+        input_file (str): Path to the input CSV file
+        output_file (str): Path to the output Excel file
+        sheet_name (str): Name of the sheet in Excel
     
-    print(f"Conversion complete: {output_file}")
+    Returns:
+        str: Path to the created Excel file
+    """
+    # Write the CSV rows straight into a write-only workbook, no formatting
+    # is applied so there is no need to build a DataFrame
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+    # utf-8-sig drops a leading byte order mark, as pandas did
+    with open(input_file, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        rows = list(reader)
+    
+    # Like pandas, store a column as numbers only when every non-empty
+    # field in it is numeric; otherwise the whole column stays text
+    numeric_columns = [
+        all(FLOAT_RE.fullmatch(value) for value in column if value)
+        for column in itertools.zip_longest(*rows, fillvalue='')
+    ]
+    
+    # Keep empty fields as blank cells
+    if header is not None:
+        worksheet.append([value if value else None for value in header])
+    for row in rows:
+        worksheet.append([
+            None if not value else number_value(value) if numeric else value
+            for value, numeric in zip(row, numeric_columns)
+        ])
+    workbook.save(output_file)
     return output_file
 
-def convert_directory(input_dir, output_dir=None, recursive=False):
+def convert_directory(input_dir, output_dir=None, recursive=False, jobs=None):
     """
     Convert all CSV files in a directory to Excel format.
     
@@ -48,6 +96,8 @@ def convert_directory(input_dir, output_dir=None, recursive=False):
         input_dir (str): Path to the input directory containing CSV files
         output_dir (str, optional): Path to the output directory for Excel files
         recursive (bool): Whether to process subdirectories recursively
+        jobs (int, optional): Number of files converted in parallel. If not provided,
+                              uses one worker process per CPU
     """
     input_path = Path(input_dir)
     
@@ -70,7 +120,8 @@ def convert_directory(input_dir, output_dir=None, recursive=False):
     
     print(f"Found {len(csv_files)} CSV files to convert")
     
-    # Convert each file
+    input_files = []
+    output_files = []
     for csv_file in csv_files:
         # Determine relative path from input directory
         rel_path = csv_file.relative_to(input_path)
@@ -79,11 +130,26 @@ def convert_directory(input_dir, output_dir=None, recursive=False):
         output_file_dir = output_path / rel_path.parent
         output_file_dir.mkdir(parents=True, exist_ok=True)
         
-        # Determine output file path
-        output_file = output_file_dir / f"{rel_path.stem}.xlsx"
-        
-        # Convert the file
-        convert_csv_to_excel(str(csv_file), str(output_file))
+        # Queue the file with its output path
+        input_files.append(str(csv_file))
+        output_files.append(str(output_file_dir / f"{rel_path.stem}.xlsx"))
+    
+    # A single file or worker gains nothing from a process pool
+    if len(input_files) == 1 or jobs == 1:
+        for input_file, output_file in zip(input_files, output_files):
+            convert_csv_to_excel(input_file, output_file)
+        return
+    
+    # Files are independent, so convert them in parallel worker processes.
+    # Only this process prints, so progress lines never interleave.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = []
+        for input_file, output_file in zip(input_files, output_files):
+            sheet_name = Path(input_file).stem
+            print(f"Converting {input_file} to {output_file} (sheet: {sheet_name})")
+            futures.append(executor.submit(write_csv_workbook, input_file, output_file, sheet_name))
+        for future in as_completed(futures):
+            print(f"Conversion complete: {future.result()}")
 
 def convert_version_comparison(input_file, output_file=None):
     """
@@ -102,8 +168,12 @@ def convert_version_comparison(input_file, output_file=None):
     
     print(f"Converting version comparison {input_file} to {output_file}")
     
-    # Read the CSV file
-    df = pd.read_csv(input_file)
+    # Read the CSV file, with the CPU names as strings and the X marks of
+    # every compiler version column as categories
+    columns = pd.read_csv(input_file, nrows=0).columns
+    dtype = {col: 'category' for col in columns[1:]}
+    dtype[columns[0]] = 'string'
+    df = pd.read_csv(input_file, dtype=dtype, keep_default_na=False, na_values=[''])
     
     # Write to Excel
     with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
@@ -115,31 +185,28 @@ def convert_version_comparison(input_file, output_file=None):
         
         # Add conditional formatting (highlight cells with 'X')
         from openpyxl.styles import PatternFill
-        from openpyxl.formatting.rule import FormulaRule
+        from openpyxl.formatting.rule import CellIsRule
         
         # Light green fill for cells with 'X'
         green_fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
         
-        # Apply to all data cells
-        for col in range(2, len(df.columns) + 1):  # Start from column B (index 2 in openpyxl)
-            col_letter = worksheet.cell(row=1, column=col).column_letter
+        # Apply one rule to all data cells, starting from column B
+        if len(df.columns) > 1:
+            last_col = get_column_letter(len(df.columns))
             worksheet.conditional_formatting.add(
-                f"{col_letter}2:{col_letter}{len(df) + 1}",
-                FormulaRule(formula=[f'${col_letter}2="X"'], fill=green_fill)
+                f"B2:{last_col}{len(df) + 1}",
+                CellIsRule(operator='equal', formula=['"X"'], fill=green_fill)
             )
         
         # Freeze the first row and column
         worksheet.freeze_panes = 'B2'
         
-        # Auto-adjust column widths
-        for col in worksheet.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
+        # Auto-adjust column widths from the longest value or header per column
+        widths = df.apply(lambda col: col.dropna().astype(str).str.len().max()).fillna(0).astype(int)
+        widths = np.maximum(widths.values, [len(str(col)) for col in df.columns])
+        for col, max_length in enumerate(widths, start=1):
             adjusted_width = (max_length + 2) * 1.2
-            worksheet.column_dimensions[column].width = adjusted_width
+            worksheet.column_dimensions[get_column_letter(col)].width = adjusted_width
     
     print(f"Conversion complete: {output_file}")
     return output_file
@@ -150,9 +217,13 @@ def main():
     parser.add_argument('-o', '--output', help='Output Excel file or directory')
     parser.add_argument('-r', '--recursive', action='store_true', help='Process directories recursively')
     parser.add_argument('-c', '--comparison', action='store_true', help='Format as version comparison file')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of files converted in parallel (default: CPU count)')
     
     args = parser.parse_args()
     
+    if args.jobs is not None and args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {args.jobs}")
+    
     input_path = Path(args.input)
     
     if not input_path.exists():
@@ -160,7 +231,7 @@ def main():
         sys.exit(1)
     
     if input_path.is_dir():
-        convert_directory(args.input, args.output, args.recursive)
+        convert_directory(args.input, args.output, args.recursive, args.jobs)
     else:
         if args.comparison:
             convert_version_comparison(args.input, args.output)
@@ -1,109 +1,83 @@
 #!/usr/bin/env python3
-import csv
 import argparse
 import os
 import glob
 from collections import defaultdict
+from pathlib import Path
+import numpy as np
+import pandas as pd
 
 def read_csv_file(filepath):
     """Read CSV file and extract extension data based on format."""
-    extensions = {}
-    with open(filepath, 'r', encoding='utf-8') as file:
-        reader = csv.reader(file)
-        headers = next(reader)  # Read header row
-        
-        # Determine file format based on header
-        has_description = 'Description' in headers
-        
-        for row in reader:
-            if len(row) < 2:  # Skip empty rows
-                continue
-                
-            name = row[0].strip()
-            version = row[1].strip()
-            
-            # Create a unique key using name-version
-            key = f"{name}-{version}"
-            
-            # Store description if available
-            if has_description and len(row) > 2:
-                extensions[key] = {
-                    'name': name,
-                    'version': version,
-                    'description': row[2]  # Preserve quotes in description
-                }
-            else:
-                extensions[key] = {
-                    'name': name,
-                    'version': version,
-                    'description': ""
-                }
-    
-    return extensions
+    # Read the header first and then only its columns, so rows with extra
+    # fields are truncated like csv.reader did. The python engine leaves
+    # fields missing from short rows as NaN, while empty fields stay ''.
+    header = pd.read_csv(filepath, header=None, nrows=1, dtype=str).iloc[0].tolist()
+    df = pd.read_csv(filepath, dtype=str, engine='python', header=None, skiprows=1,
+                     names=header, usecols=range(len(header)),
+                     keep_default_na=False, na_values=[])
+    
+    # Skip rows with fewer than two fields
+    df = df[df['Version'].notna()]
+    
+    extensions = pd.DataFrame({
+        'name': df['Name'].str.strip(),
+        'version': df['Version'].str.strip(),
+        # Preserve quotes in description, files without one get it empty
+        'description': df['Description'].fillna('') if 'Description' in df.columns else '',
+    })
+    
+    # A repeated name-version keeps its last row
+    return extensions.drop_duplicates(['name', 'version'], keep='last')
 
 def merge_csv_files(input_files, output_file, include_description=True):
     """Merge multiple CSV files into one consolidated file."""
-    all_extensions = {}
-    file_sources = []
+    key_columns = ['name', 'version']
+    frames = []
+    # Remove .csv extension from the displayed column names
+    file_sources = [Path(input_file).stem for input_file in input_files]
     
     # Read all input files
-    for input_file in input_files:
-        filename = os.path.basename(input_file)
-        # Remove .csv extension from the displayed column name
-        column_name = os.path.splitext(filename)[0]
-        file_sources.append(column_name)
+    for input_file, column_name in zip(input_files, file_sources):
         extensions = read_csv_file(input_file)
-        
-        # Add to all_extensions
-        for key, ext_data in extensions.items():
-            if key not in all_extensions:
-                all_extensions[key] = {
-                    'name': ext_data['name'],
-                    'version': ext_data['version'],
-                    'description': ext_data['description'],
-                    'sources': {}
-                }
-            elif not all_extensions[key]['description'] and ext_data['description']:
-                # Update description if it was empty and we now have one
-                all_extensions[key]['description'] = ext_data['description']
-                
-            # Mark this file as having this extension
-            all_extensions[key]['sources'][column_name] = True
-    
-    # Write consolidated output
+        frames.append(extensions.assign(source=column_name))
+    
+    all_extensions = pd.concat(frames, ignore_index=True)
+    
+    # Sort by name and then by version, keeping the first non-empty
+    # description seen for each extension
+    unique_extensions = (all_extensions
+                         .assign(no_description=all_extensions['description'].eq(''))
+                         .sort_values(key_columns + ['no_description'], kind='stable')
+                         .drop_duplicates(key_columns, ignore_index=True)[key_columns + ['description']])
+    
+    # Mark each file as having its extensions by probing its set of
+    # name-version keys, one Y/N column per file
+    keys = pd.MultiIndex.from_frame(unique_extensions[key_columns])
+    presence = pd.DataFrame({
+        source: np.where(keys.isin(pd.MultiIndex.from_frame(group[key_columns])), 'Y', 'N')
+        for source, group in all_extensions.groupby('source', sort=False)
+    }, index=unique_extensions.index)
+    merged = pd.concat([unique_extensions, presence], axis=1)
+    
+    # Include or exclude the Description column based on the include_description flag
+    headers = ['Name', 'Version']
+    columns = list(key_columns)
+    if include_description:
+        headers.append('Description')
+        columns.append('description')
+    headers.extend(file_sources)
+    columns.extend(file_sources)
+    
+    # Mark missing extensions with N
+    merged = merged.reindex(columns=columns).fillna('N')
+    
+    # Render the whole CSV in memory and write it with a single call
     with open(output_file, 'w', newline='', encoding='utf-8') as file:
-        # Include or exclude the Description column based on the include_description flag
-        headers = ['Name', 'Version']
-        if include_description:
-            headers.append('Description')
-        headers.extend(file_sources)
-        
-        writer = csv.writer(file)
-        writer.writerow(headers)
-        
-        # Sort by name and then by version
-        sorted_keys = sorted(all_extensions.keys(), 
-                            key=lambda k: (all_extensions[k]['name'], all_extensions[k]['version']))
-        
-        for key in sorted_keys:
-            ext = all_extensions[key]
-            row = [
-                ext['name'],
-                ext['version']
-            ]
-            
-            # Add description if needed
-            if include_description:
-                row.append(ext['description'])
-            
-            # Add Y/N for each source file
-            for source in file_sources:
-                row.append('Y' if source in ext['sources'] else 'N')
-                
-            writer.writerow(row)
+        file.write(merged.to_csv(index=False, header=headers, lineterminator='\r\n'))
     
     print(f"Successfully merged {len(input_files)} files into {output_file}")
-    print(f"Found {len(all_extensions)} unique extensions")
+    print(f"Found {len(merged)} unique extensions")
 
 def main():
     parser = argparse.ArgumentParser(description='Merge RISC-V extension CSV files.')